@@ -3,26 +3,51 @@
 Data layer and simple AI analysis for Smart Expense AI.
 
 Features:
-- CSV-based persistent storage
+- CSV-based persistent storage, with an optional Parquet snapshot for fast loads
 - Helpers for loading, adding and filtering expenses
 - Monthly spending prediction using a simple linear regression model
 """
 
 from __future__ import annotations
 
+import csv
+import importlib.util
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
+from pandas.api.types import union_categoricals
+
+# Optional, enables the Parquet snapshot. Only check that it is installed;
+# pandas imports it on first use so it does not slow down app startup.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
 
 # Store data next to this file
 DATA_FILE = Path(__file__).with_name("expenses.csv")
 
+# Typed copy of DATA_FILE, reused while the CSV's (mtime_ns, size) matches
+# the key stored in its schema metadata
+SNAPSHOT_FILE = DATA_FILE.with_suffix(".parquet")
+_SNAPSHOT_KEY = b"smart_expense_ai.csv_key"
+
+# Date format entered in the UI and written to CSV
+DATE_FORMAT = "%Y-%m-%d"
+
+# Columns persisted to CSV (derived helper columns are prefixed with "_")
+COLUMNS = ["date", "category", "amount"]
+
+# Last parsed DataFrame, keyed by the CSV's (mtime_ns, size)
+_CACHE: Dict[str, Any] = {"key": None, "df": None}
+
+# Recent predict_next_month results, keyed by a fingerprint of the input
+_PREDICT_CACHE: Dict[Tuple[int, int], Tuple[Optional[float], str]] = {}
+_PREDICT_CACHE_SIZE = 4
+
 
 def _init_file() -> pd.DataFrame:
     """Create an empty CSV if it does not exist and return a DataFrame."""
-    df = pd.DataFrame(columns=["date", "category", "amount"])
+    df = pd.DataFrame(columns=COLUMNS)
     df.to_csv(DATA_FILE, index=False)
     return df
 
@@ -31,34 +56,208 @@ def load_data() -> pd.DataFrame:
     """
     Load expenses from CSV, creating the file if needed.
 
+    The parsed result is cached and reused until the file's modification
+    time or size changes. When pyarrow is installed, a Parquet snapshot
+    of the parsed data is also kept on disk so later runs can skip
+    CSV parsing while the CSV is unchanged.
+
     Returns
     -------
     pd.DataFrame
-        DataFrame with columns: date (str), category (str), amount (float)
+        DataFrame with columns: date (datetime64), category (category),
+        amount (float), plus a lowercase ``_cat_lower`` helper column
     """
     if not DATA_FILE.exists():
-        df = _init_file()
-    else:
-        df = pd.read_csv(DATA_FILE)
+        _init_file()
+
+    st = DATA_FILE.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if _CACHE["key"] == key:
+        return _CACHE["df"].copy(deep=False)
 
+    df = _read_snapshot(key)
+    if df is None:
+        df = _read_csv()
+        _write_snapshot(df, key)
+
+    _CACHE["key"] = key
+    _CACHE["df"] = df
+    return df.copy(deep=False)
+
+
+def _read_csv() -> pd.DataFrame:
+    """Parse DATA_FILE and normalize columns and types."""
+    if _HAS_PYARROW:
+        # pyarrow's multithreaded parser is faster. Dates are converted by
+        # _parse_dates rather than parse_dates=, which is slower on this
+        # path. Fall back to the default engine for files it cannot cast
+        # cleanly.
+        try:
+            df = pd.read_csv(
+                DATA_FILE,
+                engine="pyarrow",
+                dtype={"amount": "float64"},
+            )
+            return _normalize(df)
+        except (ValueError, KeyError):
+            pass
+    return _normalize(pd.read_csv(DATA_FILE))
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Ensure the expected columns exist and have the expected types."""
     # Normalize columns
-    expected_cols = ["date", "category", "amount"]
-    for col in expected_cols:
+    for col in COLUMNS:
         if col not in df.columns:
             df[col] = None
-    df = df[expected_cols]
+    df = df[COLUMNS]
 
     # Clean types
-    df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0.0)
+    df["date"] = _parse_dates(df["date"])
+    # Currency: float32 cannot hold paise above about 131,072, so keep float64
+    df["amount"] = (
+        pd.to_numeric(df["amount"], errors="coerce").fillna(0.0).astype(np.float64)
+    )
+    return _set_category_columns(df)
+
+
+def _encode_key(key: Tuple[int, int]) -> bytes:
+    return f"{key[0]}:{key[1]}".encode()
+
+
+def _read_snapshot(key: Tuple[int, int]) -> Optional[pd.DataFrame]:
+    """Return the Parquet snapshot if it was written from this exact CSV."""
+    if not _HAS_PYARROW or not SNAPSHOT_FILE.exists():
+        return None
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(SNAPSHOT_FILE).metadata or {}
+        if metadata.get(_SNAPSHOT_KEY) != _encode_key(key):
+            return None
+        return pd.read_parquet(SNAPSHOT_FILE, engine="pyarrow")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_snapshot(df: pd.DataFrame, key: Tuple[int, int]) -> None:
+    """Write a Parquet snapshot of the parsed data; failures are ignored."""
+    if not _HAS_PYARROW:
+        return
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_SNAPSHOT_KEY] = _encode_key(key)
+        table = table.replace_schema_metadata(metadata)
+        pq.write_table(table, SNAPSHOT_FILE, compression="snappy")
+    except (OSError, ValueError, TypeError):
+        pass
+
+
+def _parse_dates(col: pd.Series) -> pd.Series:
+    """
+    Parse a date column, using the fixed-format fast path for YYYY-MM-DD.
+
+    Values in any other format fall back to pandas' flexible parser, so
+    older or hand-edited rows are still read as before.
+    """
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col
+    parsed = pd.to_datetime(col, format=DATE_FORMAT, errors="coerce")
+    retry = parsed.isna() & col.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(col[retry], format="mixed", errors="coerce")
+    return parsed
+
+
+def _set_category_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store category as categorical and add its lowercase form for filtering."""
+    category = _str_categorical(df["category"])
+    df["category"] = category
+    df["_cat_lower"] = _str_categorical(category.str.lower())
     return df
 
 
+def _str_categorical(values: pd.Series) -> pd.Series:
+    """
+    Convert to a categorical whose categories are always str-typed, so
+    frames can be merged with ``union_categoricals`` even when one is empty.
+    """
+    category = values.astype("category")
+    return category.cat.rename_categories(category.cat.categories.astype(str))
+
+
+def append_to_frame(df: pd.DataFrame, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Return ``df`` with new rows (as returned by ``add_expense``) appended.
+
+    Only the new rows are normalized; the categorical columns are merged
+    with ``union_categoricals`` so existing rows are not re-encoded.
+    """
+    if not rows:
+        return df
+    new = _normalize(pd.DataFrame(rows, columns=COLUMNS))
+
+    def merged(col: str) -> pd.Categorical:
+        # Re-wrapping the existing column only touches its categories; it
+        # matters for empty frames read back from the Parquet snapshot.
+        return union_categoricals([_str_categorical(df[col]), new[col]])
+
+    return pd.DataFrame(
+        {
+            "date": pd.concat([df["date"], new["date"]], ignore_index=True),
+            "category": merged("category"),
+            "amount": pd.concat([df["amount"], new["amount"]], ignore_index=True),
+            "_cat_lower": merged("_cat_lower"),
+        }
+    )
+
+
+def _invalidate_cache() -> None:
+    """Drop the cached DataFrame and snapshot so the next load re-reads the CSV."""
+    _CACHE["key"] = None
+    _CACHE["df"] = None
+    _PREDICT_CACHE.clear()
+    # Best effort: a snapshot left behind is rejected by its CSV key anyway
+    try:
+        SNAPSHOT_FILE.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def save_data(df: pd.DataFrame) -> None:
     """Persist DataFrame to CSV."""
-    df.to_csv(DATA_FILE, index=False)
+    df[COLUMNS].to_csv(DATA_FILE, index=False)
+    _invalidate_cache()
 
 
-def add_expense(date: str, category: str, amount: float) -> pd.DataFrame:
+def append_expense_row(date: str, category: str, amount: float) -> None:
+    """
+    Append a single expense line to the CSV without rewriting the file.
+
+    The header is written once by ``_init_file`` when the file is missing.
+    A hand-edited file may lack a final newline; one is added first so the
+    new row does not run into the last one.
+    """
+    if not DATA_FILE.exists() or DATA_FILE.stat().st_size == 0:
+        _init_file()
+    with open(DATA_FILE, "rb") as f:
+        f.seek(0, 2)
+        needs_newline = False
+        if f.tell() > 0:
+            f.seek(-1, 2)
+            needs_newline = f.read(1) != b"\n"
+    with open(DATA_FILE, "a", newline="") as f:
+        if needs_newline:
+            f.write("\n")
+        csv.writer(f, lineterminator="\n").writerow([date, category, float(amount)])
+    _invalidate_cache()
+
+
+def add_expense(date: str, category: str, amount: float) -> Dict[str, Any]:
     """
     Append a new expense to the dataset and save.
 
@@ -73,14 +272,15 @@ def add_expense(date: str, category: str, amount: float) -> pd.DataFrame:
 
     Returns
     -------
-    pd.DataFrame
-        Updated DataFrame
+    dict
+        The stored row with keys: date (parsed), category, amount
     """
-    df = load_data()
-    new_row = {"date": date, "category": category, "amount": float(amount)}
-    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-    save_data(df)
-    return df
+    append_expense_row(date, category, amount)
+    return {
+        "date": pd.to_datetime(date, errors="coerce"),
+        "category": category,
+        "amount": float(amount),
+    }
 
 
 def filter_data(
@@ -93,6 +293,7 @@ def filter_data(
     Filter expenses by optional date range and category.
 
     Dates should be in a format recognized by pandas (e.g. YYYY-MM-DD).
+    The ``date`` column is expected to be already parsed by ``load_data``.
     """
     if df is None:
         df = load_data()
@@ -100,26 +301,24 @@ def filter_data(
     if df.empty:
         return df
 
-    # Work on a copy
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    # Combine all conditions into one mask so the frame is sliced only once
+    mask = np.ones(len(df), dtype=bool)
+    dates = df["date"].to_numpy()
 
     if start_date:
         start = pd.to_datetime(start_date, errors="coerce")
         if pd.notna(start):
-            df = df[df["date"] >= start]
+            mask &= dates >= start.to_datetime64()
 
     if end_date:
         end = pd.to_datetime(end_date, errors="coerce")
         if pd.notna(end):
-            df = df[df["date"] <= end]
+            mask &= dates <= end.to_datetime64()
 
     if category and category != "All":
-        df = df[df["category"].astype(str).str.lower() == category.lower()]
+        mask &= (df["_cat_lower"] == category.lower()).to_numpy()
 
-    # Convert date back to string for display
-    df["date"] = df["date"].dt.strftime("%Y-%m-%d")
-    return df
+    return df.loc[mask]
 
 
 def compute_summary(df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
@@ -149,7 +348,13 @@ def compute_summary(df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
     count = int(df["amount"].count())
     average = float(total / count) if count else 0.0
     max_val = float(df["amount"].max()) if count else 0.0
-    by_cat_series = df.groupby("category")["amount"].sum().sort_values(ascending=False)
+    # Group on the categorical codes without sorting keys; only the small
+    # per-category result is sorted.
+    by_cat_series = (
+        df.groupby("category", observed=True, sort=False)["amount"]
+        .sum()
+        .sort_values(ascending=False)
+    )
     by_category = {str(k): float(v) for k, v in by_cat_series.items()}
 
     return {
@@ -166,15 +371,19 @@ def _monthly_totals(df: pd.DataFrame) -> pd.Series:
     if df.empty:
         return pd.Series(dtype=float)
 
-    d = df.copy()
-    d["date"] = pd.to_datetime(d["date"], errors="coerce")
-    d = d.dropna(subset=["date"])
+    d = df.dropna(subset=["date"])
     if d.empty:
         return pd.Series(dtype=float)
 
-    d["month"] = d["date"].dt.to_period("M")
-    monthly = d.groupby("month")["amount"].sum().sort_index()
-    return monthly
+    # Bucket by months since epoch and sum in one pass; np.unique returns
+    # the keys already sorted, so no separate sort is needed.
+    months = d["date"].to_numpy().astype("datetime64[M]").astype(np.int64)
+    amounts = d["amount"].to_numpy(dtype=np.float64)
+    keys, codes = np.unique(months, return_inverse=True)
+    sums = np.bincount(codes, weights=amounts, minlength=keys.size)
+
+    index = pd.Index(keys.astype("datetime64[M]"), name="month")
+    return pd.Series(sums, index=index, name="amount")
 
 
 def predict_next_month(
@@ -192,28 +401,58 @@ def predict_next_month(
     if df is None:
         df = load_data()
 
-    monthly = _monthly_totals(df)
-    if len(monthly) == 0:
-        return None, "Not enough data to analyze yet. Add some expenses first."
+    # Repeated analysis of unchanged data reuses the previous result
+    key = _fingerprint(df)
+    if key in _PREDICT_CACHE:
+        return _PREDICT_CACHE[key]
+
+    result = _predict(df)
+    if len(_PREDICT_CACHE) >= _PREDICT_CACHE_SIZE:
+        _PREDICT_CACHE.pop(next(iter(_PREDICT_CACHE)))
+    _PREDICT_CACHE[key] = result
+    return result
 
-    if len(monthly) == 1:
-        # With only one month, just reuse that as a naive forecast
-        pred = float(monthly.iloc[0])
+
+def _fingerprint(df: pd.DataFrame) -> Tuple[int, int]:
+    """Cheap content key over the columns the prediction depends on."""
+    hashes = pd.util.hash_pandas_object(df[["date", "amount"]], index=False)
+    return len(df), int(hashes.sum())
+
+
+def _predict(df: pd.DataFrame) -> Tuple[Optional[float], str]:
+    """Uncached implementation of ``predict_next_month``."""
+    no_data = "Not enough data to analyze yet. Add some expenses first."
+    if df.empty:
+        return None, no_data
+
+    dates = df["date"]
+    first, last = dates.min(), dates.max()
+    if pd.isna(first):
+        return None, no_data
+
+    if (first.year, first.month) == (last.year, last.month):
+        # With only one month, just reuse that as a naive forecast.
+        # Every dated row is in that month, so no month binning is needed.
+        dated = dates.notna().to_numpy()
+        pred = float(df["amount"].to_numpy()[dated].sum())
         advice = (
             f"Based on last month, you may spend about ₹{pred:.2f} next month. "
             "Add more data for a smarter trend-based prediction."
         )
         return round(pred, 2), advice
 
-    # Use simple index as time feature: 0, 1, 2, ...
-    X = [[i] for i in range(len(monthly))]
-    y = monthly.values
+    monthly = _monthly_totals(df)
 
-    model = LinearRegression()
-    model.fit(X, y)
+    # Ordinary least squares on a simple time index: 0, 1, 2, ...
+    y = monthly.to_numpy(dtype=np.float64)
+    n = y.size
+    x = np.arange(n, dtype=np.float64)
+    xm = x.mean()
+    ym = y.mean()
+    slope = ((x - xm) * (y - ym)).sum() / ((x - xm) ** 2).sum()
+    intercept = ym - slope * xm
 
-    next_idx = [[len(monthly)]]
-    pred = float(model.predict(next_idx)[0])
+    pred = float(slope * n + intercept)
     pred = round(pred, 2)
 
     # Simple rule-of-thumb safety band
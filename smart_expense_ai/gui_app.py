@@ -17,8 +17,12 @@ from tkinter import messagebox
 from tkinter import ttk
 from typing import Optional
 
+import numpy as np
+
 from expense_model import (
+    DATE_FORMAT,
     add_expense,
+    append_to_frame,
     load_data,
     filter_data,
     compute_summary,
@@ -53,6 +57,13 @@ class SmartExpenseApp(tk.Tk):
         # Shared state
         self.df = load_data()
 
+        # Table virtualization: only the visible slice of _view_df is in the tree
+        self._view_df = self.df
+        self._view_top = 0
+        self._tree_item_ids = []
+        # Selected row as a position in _view_df (tree item ids are screen slots)
+        self._selected_pos = None
+
         # Build UI structure
         self._build_header()
         self._build_main_layout()
@@ -217,13 +228,22 @@ class SmartExpenseApp(tk.Tk):
         self.tree.column("category", width=160, anchor="w")
         self.tree.column("amount", width=100, anchor="e")
 
-        vsb = ttk.Scrollbar(
-            table_frame, orient="vertical", command=self.tree.yview
+        # The scrollbar drives our own paging instead of tree.yview, since
+        # the tree only ever holds the rows that fit on screen.
+        self.vsb = ttk.Scrollbar(
+            table_frame, orient="vertical", command=self._on_table_scroll
         )
-        self.tree.configure(yscrollcommand=vsb.set)
 
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.vsb.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind("<Configure>", lambda _e: self._render_visible_rows())
+        self.tree.bind("<MouseWheel>", self._on_table_mousewheel)
+        self.tree.bind("<Button-4>", self._on_table_mousewheel)
+        self.tree.bind("<Button-5>", self._on_table_mousewheel)
+        self.tree.bind("<<TreeviewSelect>>", self._on_table_select)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(key, self._on_table_key)
 
         # ----- Right: Summary & AI panel -----
         summary_frame = ttk.LabelFrame(
@@ -231,16 +251,20 @@ class SmartExpenseApp(tk.Tk):
         )
         summary_frame.pack(fill=tk.X, pady=(0, 8), padx=(8, 0))
 
-        self.lbl_total = ttk.Label(summary_frame, text="Total: ₹0.00")
+        self.var_total = tk.StringVar(value="Total: ₹0.00")
+        self.lbl_total = ttk.Label(summary_frame, textvariable=self.var_total)
         self.lbl_total.pack(anchor="w")
 
-        self.lbl_avg = ttk.Label(summary_frame, text="Average per entry: ₹0.00")
+        self.var_avg = tk.StringVar(value="Average per entry: ₹0.00")
+        self.lbl_avg = ttk.Label(summary_frame, textvariable=self.var_avg)
         self.lbl_avg.pack(anchor="w", pady=(2, 0))
 
-        self.lbl_max = ttk.Label(summary_frame, text="Highest single expense: ₹0.00")
+        self.var_max = tk.StringVar(value="Highest single expense: ₹0.00")
+        self.lbl_max = ttk.Label(summary_frame, textvariable=self.var_max)
         self.lbl_max.pack(anchor="w", pady=(2, 0))
 
-        self.lbl_count = ttk.Label(summary_frame, text="Number of entries: 0")
+        self.var_count = tk.StringVar(value="Number of entries: 0")
+        self.lbl_count = ttk.Label(summary_frame, textvariable=self.var_count)
         self.lbl_count.pack(anchor="w", pady=(2, 0))
 
         ttk.Separator(right_frame, orient="horizontal").pack(
@@ -280,15 +304,18 @@ class SmartExpenseApp(tk.Tk):
             return
 
         try:
-            self.df = add_expense(date, category, amount)
+            new_row = add_expense(date, category, amount)
         except Exception as e:
             messagebox.showerror(
                 "Error", f"Failed to save expense:\n{e}"
             )
             return
 
+        # Keep the in-memory copy in sync instead of re-reading the CSV
+        self.df = append_to_frame(self.df, [new_row])
+
         self._populate_table(self.df)
-        self._update_summary_panel()
+        self._update_summary_panel(self.df)
         self._refresh_filter_categories()
         self.on_clear_form()
 
@@ -322,70 +349,160 @@ class SmartExpenseApp(tk.Tk):
         self.entry_end_date.delete(0, tk.END)
         self.filter_category_var.set("All")
         self._populate_table(self.df)
-        self._update_summary_panel()
+        self._update_summary_panel(self.df)
 
     def on_ai_analyze(self):
-        filtered_df = self._get_current_table_df()
-        pred, advice = predict_next_month(filtered_df if not filtered_df.empty else self.df)
+        # Analyze what the table shows (the filtered view, if any)
+        df_for_ai = self._view_df
+        pred, advice = predict_next_month(df_for_ai if not df_for_ai.empty else self.df)
         if pred is None:
             result_text = advice
         else:
             result_text = f"Predicted next month spending: ₹{pred:.2f}\n\n{advice}"
         set_text(self.ai_text, result_text)
 
-    # ----- Helpers -----
-    def _populate_table(self, df):
-        # Clear table
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _on_table_scroll(self, *args):
+        total = len(self._view_df)
+        _, full = self._table_row_counts()
+        if args[0] == "moveto":
+            top = int(float(args[1]) * total)
+        else:
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= full
+            top = self._view_top + step
+        self._scroll_table_to(top)
+
+    def _on_table_mousewheel(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll_table_to(self._view_top - 3)
+        else:
+            self._scroll_table_to(self._view_top + 3)
+        return "break"
+
+    def _on_table_select(self, _event):
+        selected = self.tree.selection()
+        # Ignore the empty selection set while the row is scrolled out of view
+        if selected:
+            self._selected_pos = self._view_top + int(selected[0])
+
+    def _on_table_key(self, event):
+        # The tree only holds the visible rows, so keyboard navigation has
+        # to move through _view_df itself and page the view along with it.
+        total = len(self._view_df)
+        if not total:
+            return "break"
+        _, page = self._table_row_counts()
+        top = self._view_top
+
+        if event.keysym == "Home":
+            pos = 0
+        elif event.keysym == "End":
+            pos = total - 1
+        elif self._selected_pos is None:
+            pos = top
+        else:
+            step = {"Up": -1, "Down": 1, "Prior": -page, "Next": page}
+            pos = self._selected_pos + step[event.keysym]
+        pos = min(max(0, pos), total - 1)
 
-        if df is None or df.empty:
-            return
+        # Scroll just enough to bring the selected row into view
+        if pos < top:
+            top = pos
+        elif pos >= top + page:
+            top = pos - page + 1
 
-        for _, row in df.iterrows():
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    str(row.get("date", "")),
-                    str(row.get("category", "")),
-                    f"{float(row.get('amount', 0.0)):.2f}",
-                ),
-            )
+        self._selected_pos = pos
+        self._view_top = top
+        self._render_visible_rows()
+        return "break"
 
-    def _update_summary_panel(self, df: Optional[object] = None):
-        summary = compute_summary(df)
-        self.lbl_total.config(text=f"Total: ₹{summary['total']:.2f}")
-        self.lbl_avg.config(
-            text=f"Average per entry: ₹{summary['average']:.2f}"
-        )
-        self.lbl_max.config(
-            text=f"Highest single expense: ₹{summary['max']:.2f}"
-        )
-        self.lbl_count.config(
-            text=f"Number of entries: {summary['count']}"
-        )
-
-    def _get_current_table_df(self):
+    # ----- Helpers -----
+    def _table_row_counts(self):
         """
-        Reconstruct a DataFrame from the current contents of the Treeview.
-        This lets AI analysis work on the filtered view as well.
+        Return (rows to render, rows fully visible) for the current height.
+
+        The first count includes a partly visible last row; scrolling
+        limits and the scrollbar use the second so the last row of the
+        view can always be brought fully on screen.
         """
-        import pandas as pd
+        try:
+            row_height = int(self.style.lookup("Treeview", "rowheight") or 20)
+        except (tk.TclError, ValueError):
+            row_height = 20
+        # Measure where the first row starts (heading plus border); before
+        # any row is shown, assume the heading is one row tall.
+        first_y = row_height
+        if self._tree_item_ids:
+            bbox = self.tree.bbox(self._tree_item_ids[0])
+            if bbox:
+                first_y, row_height = bbox[1], bbox[3]
+        available = max(0, self.tree.winfo_height() - first_y)
+        full = max(1, available // row_height)
+        partial = 1 if available % row_height else 0
+        return full + partial, full
+
+    def _scroll_table_to(self, top: int):
+        _, full = self._table_row_counts()
+        max_top = max(0, len(self._view_df) - full)
+        top = min(max(0, top), max_top)
+        if top != self._view_top:
+            self._view_top = top
+            self._render_visible_rows()
+
+    def _populate_table(self, df):
+        self._view_df = df
+        self._view_top = 0
+        self._selected_pos = None
+        self._render_visible_rows()
+
+    def _render_visible_rows(self):
+        total = len(self._view_df)
+        visible, full = self._table_row_counts()
+        top = min(self._view_top, max(0, total - full))
+        self._view_top = top
+        if total:
+            self.vsb.set(top / total, min(1.0, (top + full) / total))
+        else:
+            self.vsb.set(0.0, 1.0)
 
         rows = []
-        for item_id in self.tree.get_children():
-            date, category, amount_str = self.tree.item(item_id, "values")
-            try:
-                amount = float(amount_str)
-            except ValueError:
-                amount = 0.0
-            rows.append({"date": date, "category": category, "amount": amount})
-
-        if not rows:
-            return pd.DataFrame(columns=["date", "category", "amount"])
-
-        return pd.DataFrame(rows)
+        if not self._view_df.empty:
+            df = self._view_df.iloc[top : top + visible]
+
+            # Format whole columns up front rather than building a Series per row
+            dates = df["date"].dt.strftime(DATE_FORMAT).fillna("").to_numpy()
+            cats = df["category"].astype(object).fillna("").astype(str).to_numpy()
+            amts = np.char.mod("%.2f", df["amount"].to_numpy(dtype=np.float64))
+            rows = list(zip(dates, cats, amts))
+
+        # Reuse existing items in place and add/remove only the difference,
+        # so a scroll costs one Tk call per visible row.
+        ids = self._tree_item_ids
+        for iid, values in zip(ids, rows):
+            self.tree.item(iid, values=values)
+        if len(rows) < len(ids):
+            self.tree.delete(*ids[len(rows) :])
+            del ids[len(rows) :]
+        for i in range(len(ids), len(rows)):
+            iid = str(i)
+            self.tree.insert("", tk.END, iid=iid, values=rows[i])
+            ids.append(iid)
+
+        # Item ids are screen slots, so move the selection with its row
+        slot = None if self._selected_pos is None else self._selected_pos - top
+        if slot is not None and 0 <= slot < len(rows):
+            self.tree.selection_set(ids[slot])
+            self.tree.focus(ids[slot])
+        else:
+            self.tree.selection_set(())
+
+    def _update_summary_panel(self, df: Optional[object] = None):
+        summary = compute_summary(df)
+        self.var_total.set(f"Total: ₹{summary['total']:.2f}")
+        self.var_avg.set(f"Average per entry: ₹{summary['average']:.2f}")
+        self.var_max.set(f"Highest single expense: ₹{summary['max']:.2f}")
+        self.var_count.set(f"Number of entries: {summary['count']}")
 
 
 if __name__ == "__main__":